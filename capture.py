@@ -0,0 +1,73 @@
+"""Background camera capture with a single-slot "latest frame" buffer."""
+import threading
+from typing import Callable, Optional
+
+import numpy as np
+
+
+class LatestFrame:
+    """Capture frames on a daemon thread, keeping only the newest one.
+
+    `grab` is called in a loop and returns the next frame, or None when the
+    camera fails. Older frames are overwritten rather than queued, so capture
+    overlaps with processing and the reader always gets the freshest image.
+    """
+
+    def __init__(self, grab: Callable[[], Optional[np.ndarray]]) -> None:
+        """Wrap a frame-grabbing callable; call start() to begin capturing."""
+        self._grab = grab
+        self._lock = threading.Lock()
+        self._fresh = threading.Event()
+        self._frame: Optional[np.ndarray] = None
+        self._failed = False
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "LatestFrame":
+        """Start the capture thread."""
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        """Capture loop: overwrite the slot with every new frame."""
+        while self._running:
+            frame = self._grab()
+            with self._lock:
+                if frame is None:
+                    self._failed = True
+                else:
+                    self._frame = frame
+                self._fresh.set()
+            if frame is None:
+                break
+
+    def read(self, timeout: float = 5.0) -> Optional[np.ndarray]:
+        """Wait for a frame newer than the last one read.
+
+        Returns None if the camera failed or no frame arrived within `timeout`.
+        The returned array is owned by the caller; the capture thread never
+        writes to a frame after publishing it.
+        """
+        if not self._fresh.wait(timeout):
+            return None
+        with self._lock:
+            self._fresh.clear()
+            if self._failed:
+                return None
+            return self._frame
+
+    def stop(self, timeout: float = 2.0) -> bool:
+        """Stop the capture thread and wait up to `timeout` seconds for it to exit.
+
+        Returns False if the thread is still inside `grab` (e.g. a stalled camera);
+        the caller must then not release the camera under it.
+        """
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                return False
+            self._thread = None
+        return True
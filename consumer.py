@@ -1,7 +1,7 @@
 """RabbitMQ consumer for testing pinch trigger messages."""
-import json
 from typing import Any
 
+import orjson
 import pika
 from rich.console import Console
 
@@ -12,6 +12,8 @@ from rabbitmq import (
     setup_rabbitmq_connection,
 )
 
+_console = Console()
+
 
 def handle_trigger_message(
     channel: Any,
@@ -20,17 +22,15 @@ def handle_trigger_message(
     body: bytes,
 ) -> None:
     """Callback to handle pinch trigger messages."""
-    console = Console()
-    message = body.decode('utf-8')
     try:
-        trigger_state = json.loads(message)
+        trigger_state = orjson.loads(body)
         if isinstance(trigger_state, bool):
             status = "[green]True (PINCHED)[/green]" if trigger_state else "[red]False (NOT PINCHED)[/red]"
-            console.print(f'[green]✓[/green] Received pinch trigger: {status}')
+            _console.print(f'[green]✓[/green] Received pinch trigger: {status}')
         else:
-            console.print(f'[yellow]⚠[/yellow] Invalid boolean format: {trigger_state}')
-    except (ValueError, json.JSONDecodeError) as e:
-        console.print(f'[red]✗[/red] Failed to parse trigger message "{message}": {e}')
+            _console.print(f'[yellow]⚠[/yellow] Invalid boolean format: {trigger_state}')
+    except orjson.JSONDecodeError as e:
+        _console.print(f'[red]✗[/red] Failed to parse trigger message {body!r}: {e}')
 
 
 def handle_position_message(
@@ -40,26 +40,22 @@ def handle_position_message(
     body: bytes,
 ) -> None:
     """Callback to handle position messages."""
-    console = Console()
-    message = body.decode('utf-8')
     try:
-        position = json.loads(message)
+        position = orjson.loads(body)
         if isinstance(position, list) and len(position) == 2:
             x, y = position[0], position[1]
             if isinstance(x, (int, float)) and isinstance(y, (int, float)):
-                console.print(f'[cyan]✓[/cyan] Received position: x=[yellow]{x:.3f}[/yellow], y=[yellow]{y:.3f}[/yellow]')
+                _console.print(f'[cyan]✓[/cyan] Received position: x=[yellow]{x:.3f}[/yellow], y=[yellow]{y:.3f}[/yellow]')
             else:
-                console.print(f'[yellow]⚠[/yellow] Invalid position format: {position}')
+                _console.print(f'[yellow]⚠[/yellow] Invalid position format: {position}')
         else:
-            console.print(f'[yellow]⚠[/yellow] Invalid position array format: {position}')
-    except (ValueError, json.JSONDecodeError) as e:
-        console.print(f'[red]✗[/red] Failed to parse position message "{message}": {e}')
+            _console.print(f'[yellow]⚠[/yellow] Invalid position array format: {position}')
+    except orjson.JSONDecodeError as e:
+        _console.print(f'[red]✗[/red] Failed to parse position message {body!r}: {e}')
 
 
 def start_consuming(connection: pika.BlockingConnection, channel: Any) -> None:
     """Start consuming messages from RabbitMQ."""
-    console = Console()
-    
     trigger_queue_declare = channel.queue_declare(queue='', exclusive=True)
     trigger_queue_name = trigger_queue_declare.method.queue
     
@@ -78,10 +74,10 @@ def start_consuming(connection: pika.BlockingConnection, channel: Any) -> None:
         routing_key=ROUTING_KEY_POSITION
     )
     
-    console.print(f'[cyan]Waiting for messages on exchange "{EXCHANGE_NAME}":[/cyan]')
-    console.print(f'  [dim]- Trigger:[/dim] {ROUTING_KEY_TRIGGER}')
-    console.print(f'  [dim]- Position:[/dim] {ROUTING_KEY_POSITION}')
-    console.print('[dim]Press CTRL+C to exit[/dim]')
+    _console.print(f'[cyan]Waiting for messages on exchange "{EXCHANGE_NAME}":[/cyan]')
+    _console.print(f'  [dim]- Trigger:[/dim] {ROUTING_KEY_TRIGGER}')
+    _console.print(f'  [dim]- Position:[/dim] {ROUTING_KEY_POSITION}')
+    _console.print('[dim]Press CTRL+C to exit[/dim]')
     
     channel.basic_consume(
         queue=trigger_queue_name,
@@ -99,19 +95,18 @@ def start_consuming(connection: pika.BlockingConnection, channel: Any) -> None:
 
 
 if __name__ == '__main__':
-    console = Console()
     connection = None
     try:
         connection, channel = setup_rabbitmq_connection()
-        console.print("[green]✓[/green] Connected to RabbitMQ")
+        _console.print("[green]✓[/green] Connected to RabbitMQ")
         start_consuming(connection, channel)
         
     except KeyboardInterrupt:
-        console.print('\n[yellow]Consumer stopped by user[/yellow]')
+        _console.print('\n[yellow]Consumer stopped by user[/yellow]')
         if connection and not connection.is_closed:
             connection.close()
     except Exception as e:
-        console.print(f'[red]Error: {e}[/red]')
+        _console.print(f'[red]Error: {e}[/red]')
         if connection and not connection.is_closed:
             connection.close()
 
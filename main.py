@@ -1,21 +1,26 @@
 """Main application for hand tracking and RabbitMQ messaging."""
 import argparse
+import os
 import time
 from typing import Optional
 
 import cv2
+import numpy as np
 from rich.console import Console
 
-from rabbitmq import send_pinch_trigger, send_thumb_position, setup_rabbitmq_connection
+from capture import LatestFrame
+from rabbitmq import BackgroundPublisher
 from tracker import (
     HandTracker,
     compute_pinch_distance,
     get_pinch_point,
-    get_thumb_tip_position,
+    get_thumb_tip_normalized,
     draw_target_visualization,
 )
 
 PINCH_DISTANCE_THRESHOLD = 40
+# Console status line and FPS overlay refresh interval (seconds), ~4 Hz
+STATUS_INTERVAL = 0.25
 
 
 def run_live(
@@ -24,10 +29,21 @@ def run_live(
     height: int = 480,
     max_num_hands: int = 1,
     use_picamera: bool = False,
+    min_detection_confidence: float = 0.7,
+    min_tracking_confidence: float = 0.3,
+    process_width: int = 320,
 ) -> None:
     """Run live hand tracking loop with RabbitMQ messaging."""
     console = Console()
-    tracker = HandTracker(max_num_hands=max_num_hands)
+    # Let OpenCV's parallel backend use every core for cvtColor/resize
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(os.cpu_count() or 4)
+    tracker = HandTracker(
+        max_num_hands=max_num_hands,
+        min_detection_confidence=min_detection_confidence,
+        min_tracking_confidence=min_tracking_confidence,
+        process_width=process_width,
+    )
 
     cap: Optional[cv2.VideoCapture] = None
     picam2 = None
@@ -43,12 +59,13 @@ def run_live(
             )
 
         picam2 = Picamera2()
-        # Follow the MediaPipe + Picamera2 example: XRGB8888 + BGRA->BGR conversion
+        # "RGB888" is BGR byte order in memory, so frames feed OpenCV/tracker directly
         config = picam2.create_preview_configuration(
-            main={"size": (width, height), "format": "XRGB8888"}
+            main={"size": (width, height), "format": "RGB888"}
         )
         picam2.configure(config)
         picam2.start()
+        grab = picam2.capture_array
         console.print("[green]✓[/green] Using Picamera2 (Pi Camera Module 3 / 3 Wide)")
     else:
         # Classic OpenCV path (USB webcam etc.)
@@ -58,63 +75,64 @@ def run_live(
 
         if not cap.isOpened():
             raise RuntimeError(f"Could not open camera index {camera_index}")
+
+        def grab() -> Optional[np.ndarray]:
+            success, frame = cap.read()
+            return frame if success else None
+
         console.print(f"[green]✓[/green] Using OpenCV VideoCapture({camera_index})")
     
     try:
-        rabbitmq_connection, rabbitmq_channel = setup_rabbitmq_connection()
+        publisher = BackgroundPublisher().start()
         console.print("[green]✓[/green] Connected to RabbitMQ")
     except Exception as e:
         console.print(f"[red]✗[/red] Failed to connect to RabbitMQ: {e}")
-        rabbitmq_connection = None
-        rabbitmq_channel = None
+        publisher = None
 
-    previous_time = time.time()
+    previous_time = time.monotonic()
     fps = 0.0
+    fps_text = ""
+    last_status_time = 0.0
     previous_pinch_state = False
 
     console.print("[dim]Press 'q' or ESC to quit.[/dim]")
 
+    # Capture runs on its own thread so camera I/O overlaps with inference
+    latest_frame = LatestFrame(grab).start()
+
     try:
         while True:
-            if use_picamera:
-                # Picamera2 returns BGRA with this configuration
-                frame_bgra = picam2.capture_array()
-                frame = cv2.cvtColor(frame_bgra, cv2.COLOR_BGRA2BGR)
-            else:
-                success, frame = cap.read()
-                if not success:
-                    console.print("[red]Failed to read frame from camera.[/red]")
-                    break
+            frame = latest_frame.read()
+            if frame is None:
+                console.print("[red]Failed to read frame from camera.[/red]")
+                break
 
             tracked_hands = tracker.process(frame)
             tracker.draw_on_frame(frame, tracked_hands)
 
-            current_time = time.time()
+            current_time = time.monotonic()
             delta_time = current_time - previous_time
             previous_time = current_time
             if delta_time > 0:
                 fps = 0.9 * fps + 0.1 * (1.0 / delta_time) if fps > 0 else 1.0 / delta_time
 
+            # Tracking logic runs every frame; only the presentation is throttled
+            status_due = current_time - last_status_time >= STATUS_INTERVAL
+            if status_due:
+                last_status_time = current_time
+                fps_text = f"{fps:.1f} FPS"
+
             if tracked_hands:
                 hand = tracked_hands[0]
                 pinch_distance = compute_pinch_distance(hand)
                 is_pinching = pinch_distance < PINCH_DISTANCE_THRESHOLD
                 
-                if is_pinching != previous_pinch_state and rabbitmq_channel is not None:
-                    try:
-                        send_pinch_trigger(rabbitmq_channel, is_pinching)
-                    except Exception as e:
-                        console.print(f"[red]Failed to send message: {e}[/red]")
+                if is_pinching != previous_pinch_state and publisher is not None:
+                    publisher.publish_pinch_trigger(is_pinching)
                 
-                if is_pinching and not previous_pinch_state and rabbitmq_channel is not None:
-                    try:
-                        thumb_x_px, thumb_y_px = get_thumb_tip_position(hand)
-                        frame_height, frame_width = frame.shape[:2]
-                        thumb_x_normalized = thumb_x_px / frame_width
-                        thumb_y_normalized = thumb_y_px / frame_height
-                        send_thumb_position(rabbitmq_channel, thumb_x_normalized, thumb_y_normalized)
-                    except Exception as e:
-                        console.print(f"[red]Failed to send position: {e}[/red]")
+                if is_pinching and not previous_pinch_state and publisher is not None:
+                    thumb_x_normalized, thumb_y_normalized = get_thumb_tip_normalized(hand)
+                    publisher.publish_thumb_position(thumb_x_normalized, thumb_y_normalized)
                 
                 if is_pinching:
                     pinch_point = get_pinch_point(hand)
@@ -122,24 +140,22 @@ def run_live(
                 
                 previous_pinch_state = is_pinching
                 
-                pinch_status = "[green]PINCH[/green]" if is_pinching else "[dim]-----[/dim]"
-                console.print(
-                    f"Hand: [cyan]{hand.handedness:5s}[/cyan] | "
-                    f"pinch: [yellow]{pinch_distance:6.1f}px[/yellow] | "
-                    f"{pinch_status}      ",
-                    end="\r",
-                )
+                if status_due:
+                    pinch_status = "[green]PINCH[/green]" if is_pinching else "[dim]-----[/dim]"
+                    console.print(
+                        f"Hand: [cyan]{hand.handedness:5s}[/cyan] | "
+                        f"pinch: [yellow]{pinch_distance:6.1f}px[/yellow] | "
+                        f"{pinch_status}      ",
+                        end="\r",
+                    )
             else:
-                if previous_pinch_state and rabbitmq_channel is not None:
-                    try:
-                        send_pinch_trigger(rabbitmq_channel, False)
-                    except Exception as e:
-                        console.print(f"[red]Failed to send message: {e}[/red]")
+                if previous_pinch_state and publisher is not None:
+                    publisher.publish_pinch_trigger(False)
                     previous_pinch_state = False
 
             cv2.putText(
                 frame,
-                f"{fps:.1f} FPS",
+                fps_text,
                 (10, 30),
                 cv2.FONT_HERSHEY_SIMPLEX,
                 1.0,
@@ -149,18 +165,23 @@ def run_live(
             )
 
             cv2.imshow("HandyPi – finger tracking", frame)
-            key = cv2.waitKey(1) & 0xFF
+            # pollKey services HighGUI events without waitKey's 1 ms sleep
+            key = cv2.pollKey() & 0xFF
             if key in (ord("q"), 27):
                 break
     finally:
+        # Never release the camera while the capture thread may still be reading it
+        capture_stopped = latest_frame.stop()
+        if not capture_stopped:
+            console.print("[yellow]⚠[/yellow] Capture thread did not stop; leaving the camera open")
         tracker.close()
-        if cap is not None:
+        if cap is not None and capture_stopped:
             cap.release()
         cv2.destroyAllWindows()
-        if picam2 is not None:
+        if picam2 is not None and capture_stopped:
             picam2.stop()
-        if rabbitmq_connection and not rabbitmq_connection.is_closed:
-            rabbitmq_connection.close()
+        if publisher is not None:
+            publisher.close()
         console.print("\n[green]Done.[/green]")
 
 
@@ -193,6 +214,24 @@ def parse_args() -> argparse.Namespace:
         default=1,
         help="Maximum number of hands to track (default: 1)",
     )
+    parser.add_argument(
+        "--min-detection-confidence",
+        type=float,
+        default=0.7,
+        help="Palm detector confidence to start tracking a hand (default: 0.7)",
+    )
+    parser.add_argument(
+        "--min-tracking-confidence",
+        type=float,
+        default=0.3,
+        help="Landmark confidence below which the palm detector re-runs (default: 0.3)",
+    )
+    parser.add_argument(
+        "--process-width",
+        type=int,
+        default=320,
+        help="Downscale frames to this width before hand tracking; 0 disables (default: 320)",
+    )
     parser.add_argument(
         "--picamera",
         action="store_true",
@@ -210,6 +249,9 @@ def main() -> None:
         height=args.height,
         max_num_hands=args.max_hands,
         use_picamera=args.picamera,
+        min_detection_confidence=args.min_detection_confidence,
+        min_tracking_confidence=args.min_tracking_confidence,
+        process_width=args.process_width,
     )
 
 
@@ -1,8 +1,11 @@
 """RabbitMQ connection and messaging utilities."""
-import json
 import os
-from typing import Any, Tuple
+import queue
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple
 
+import orjson
 import pika
 from dotenv import load_dotenv
 from rich.console import Console
@@ -13,6 +16,14 @@ EXCHANGE_NAME = os.getenv("RABBITMQ_EXCHANGE_NAME")
 EXCHANGE_TYPE = os.getenv("RABBITMQ_EXCHANGE_TYPE")
 ROUTING_KEY_POSITION = os.getenv("RABBITMQ_ROUTING_KEY_POSITION")
 ROUTING_KEY_TRIGGER = "RADr.Handout.Trigger"
+DEBUG = os.getenv("DEBUG", "").lower() in ("1", "true", "yes")
+RECONNECT_DELAY = 1.0  # seconds between reconnect attempts in BackgroundPublisher
+
+# The trigger only ever carries one of two payloads, so serialize them once
+_TRIGGER_TRUE = orjson.dumps(True)
+_TRIGGER_FALSE = orjson.dumps(False)
+
+_console = Console()
 
 
 def get_connection_parameters() -> pika.ConnectionParameters:
@@ -50,35 +61,167 @@ def setup_rabbitmq_connection() -> Tuple[pika.BlockingConnection, Any]:
         if e.reply_code == 406:
             channel = connection.channel()
         else:
+            connection.close()
             raise
     
     return connection, channel
 
 
+# Messages are published transient (no delivery_mode=2): the exchange is declared
+# non-durable, so persistence only costs broker work for a fire-and-forget stream.
 def send_thumb_position(channel: Any, thumb_x_normalized: float, thumb_y_normalized: float) -> None:
     """Send thumb tip position (normalized 0-1) to RabbitMQ as JSON array."""
-    console = Console()
-    message = json.dumps([thumb_x_normalized, thumb_y_normalized])
+    message = orjson.dumps([thumb_x_normalized, thumb_y_normalized])
     
     channel.basic_publish(
         exchange=EXCHANGE_NAME,
         routing_key=ROUTING_KEY_POSITION,
         body=message,
-        properties=pika.BasicProperties(delivery_mode=2)
     )
-    console.print(f"[dim]Sent thumb position (normalized): {message} to {EXCHANGE_NAME}/{ROUTING_KEY_POSITION}[/dim]")
+    if DEBUG:
+        _console.print(f"[dim]Sent thumb position (normalized): {message.decode()} to {EXCHANGE_NAME}/{ROUTING_KEY_POSITION}[/dim]")
 
 
 def send_pinch_trigger(channel: Any, is_pinching: bool) -> None:
     """Send pinch trigger state (True/False) to RabbitMQ routing key RADr.Handout.Trigger."""
-    console = Console()
-    message = json.dumps(is_pinching)
-    
     channel.basic_publish(
         exchange=EXCHANGE_NAME,
         routing_key=ROUTING_KEY_TRIGGER,
-        body=message,
-        properties=pika.BasicProperties(delivery_mode=2)
+        body=_TRIGGER_TRUE if is_pinching else _TRIGGER_FALSE,
     )
-    console.print(f"[dim]Sent pinch trigger: {is_pinching} to {EXCHANGE_NAME}/{ROUTING_KEY_TRIGGER}[/dim]")
+    if DEBUG:
+        _console.print(f"[dim]Sent pinch trigger: {is_pinching} to {EXCHANGE_NAME}/{ROUTING_KEY_TRIGGER}[/dim]")
+
+
+class BackgroundPublisher:
+    """Publish messages from a daemon thread so the vision loop never blocks on I/O.
+
+    Messages go through a bounded queue; when it is full the oldest message is
+    dropped. The thread owns the (non thread-safe) pika connection, keeps its
+    heartbeats serviced while idle and reconnects after connection errors.
+    """
+
+    def __init__(self, maxsize: int = 16) -> None:
+        """Create the publisher; call start() to connect and begin publishing."""
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._connection: Optional[pika.BlockingConnection] = None
+        self._channel: Any = None
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "BackgroundPublisher":
+        """Connect to RabbitMQ and start the publisher thread.
+
+        The initial connection is made synchronously so failures surface to the caller.
+        """
+        self._connection, self._channel = setup_rabbitmq_connection()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def publish_pinch_trigger(self, is_pinching: bool) -> None:
+        """Queue a pinch trigger state for publishing."""
+        self._put((send_pinch_trigger, (is_pinching,)))
+
+    def publish_thumb_position(self, thumb_x_normalized: float, thumb_y_normalized: float) -> None:
+        """Queue a normalized thumb position for publishing."""
+        self._put((send_thumb_position, (thumb_x_normalized, thumb_y_normalized)))
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Flush queued messages for up to `timeout` seconds, then stop the thread.
+
+        The publisher thread closes the connection itself on exit; if it is still
+        busy when the timeout expires it is abandoned (it is a daemon thread) rather
+        than touching its connection from here.
+        """
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            if self._thread.is_alive():
+                _console.print("[yellow]⚠[/yellow] RabbitMQ publisher did not finish; unsent messages dropped")
+            self._thread = None
+
+    def _put(self, item: Tuple[Callable[..., None], Tuple[Any, ...]]) -> None:
+        """Enqueue without blocking, dropping the oldest message on overflow."""
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _run(self) -> None:
+        """Publisher loop: drain the queue, reconnecting as needed.
+
+        Once close() clears `_running` the loop keeps publishing until the queue is
+        empty, so a final trigger isn't lost, then closes the connection.
+        """
+        while True:
+            try:
+                item = self._queue.get(timeout=1.0 if self._running else 0)
+            except queue.Empty:
+                if not self._running:
+                    break
+                item = None
+
+            # Keep the thread alive on anything unexpected; a dead publisher would
+            # otherwise just recycle the queue without a word
+            try:
+                if item is None:
+                    self._process_heartbeats()
+                else:
+                    self._publish(*item)
+            except Exception as e:
+                _console.print(f"[red]✗[/red] RabbitMQ publisher error: {e}")
+                self._channel = None
+
+        self._close_connection()
+
+    def _publish(self, send: Callable[..., None], args: Tuple[Any, ...]) -> None:
+        """Send one message, with one retry after a reconnect before dropping it."""
+        for _ in range(2):
+            if not self._ensure_connected():
+                return
+            try:
+                send(self._channel, *args)
+                return
+            except pika.exceptions.AMQPError as e:
+                _console.print(f"[red]Failed to send message: {e}[/red]")
+                self._channel = None
+
+    def _process_heartbeats(self) -> None:
+        """Service the connection while idle so the broker doesn't drop it."""
+        if self._channel is None:
+            return
+        try:
+            self._connection.process_data_events(time_limit=0)
+        except pika.exceptions.AMQPError:
+            self._channel = None
+
+    def _ensure_connected(self) -> bool:
+        """Reconnect if the channel was lost. Returns False if still disconnected."""
+        if self._channel is not None and self._channel.is_open:
+            return True
+        self._close_connection()
+        try:
+            self._connection, self._channel = setup_rabbitmq_connection()
+        except pika.exceptions.AMQPError as e:
+            _console.print(f"[red]✗[/red] RabbitMQ reconnect failed: {e}")
+            time.sleep(RECONNECT_DELAY)
+            return False
+        _console.print("[green]✓[/green] Reconnected to RabbitMQ")
+        return True
 
+    def _close_connection(self) -> None:
+        """Close the current connection, ignoring errors from an already-broken one."""
+        if self._connection is not None and not self._connection.is_closed:
+            try:
+                self._connection.close()
+            except pika.exceptions.AMQPError:
+                pass
+        self._connection = None
+        self._channel = None
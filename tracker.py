@@ -1,18 +1,28 @@
 """Hand tracking using MediaPipe with visualization utilities."""
-from dataclasses import dataclass
-from typing import List, Tuple
+import math
+import sys
+from typing import List, NamedTuple, Tuple
 
 import cv2
 import mediapipe as mp
 import numpy as np
 
+NUM_HAND_LANDMARKS = 21
 
-@dataclass
-class TrackedHand:
-    """Simple container for one tracked hand."""
+# MediaPipe hands back a fresh label string per frame; map it to one shared copy
+_HANDEDNESS_LABELS = {label: sys.intern(label) for label in ("Left", "Right")}
+
+
+class TrackedHand(NamedTuple):
+    """Lightweight view of one tracked hand.
+
+    `landmarks_px` is a slice of the tracker's reusable landmark buffer, so it
+    is only valid until the next `HandTracker.process` call.
+    """
     handedness: str                  # "Left" or "Right"
     landmarks_px: np.ndarray         # shape (21, 2), (x, y) in pixels
     bbox: Tuple[int, int, int, int]  # (x_min, y_min, x_max, y_max)
+    thumb_tip_norm: Tuple[float, float]  # landmark 4 (x, y), normalized 0-1
 
 
 class HandTracker:
@@ -22,10 +32,20 @@ class HandTracker:
         self,
         max_num_hands: int = 1,
         model_complexity: int = 0,
-        min_detection_confidence: float = 0.5,
-        min_tracking_confidence: float = 0.5,
+        min_detection_confidence: float = 0.7,
+        min_tracking_confidence: float = 0.3,
+        process_width: int = 320,
     ) -> None:
-        """Initialize MediaPipe Hands tracker with given parameters."""
+        """Initialize MediaPipe Hands tracker with given parameters.
+
+        A low tracking threshold keeps MediaPipe on the cheap landmark-only path
+        between frames; the palm detector is re-run only when tracking is lost,
+        and a higher detection threshold avoids re-detection churn on marginal hands.
+
+        Wider frames are downscaled to `process_width` before inference (MediaPipe's
+        networks run at ~224 px anyway); landmarks are still reported in original
+        frame pixels. Set it to 0 to feed full-resolution frames.
+        """
         self._mp_hands = mp.solutions.hands
         self._hands = self._mp_hands.Hands(
             static_image_mode=False,
@@ -34,11 +54,38 @@ class HandTracker:
             min_detection_confidence=min_detection_confidence,
             min_tracking_confidence=min_tracking_confidence,
         )
+        self._landmarks_px = np.empty(
+            (max_num_hands, NUM_HAND_LANDMARKS, 2), dtype=np.int32
+        )
+        self._connections = np.array(
+            list(self._mp_hands.HAND_CONNECTIONS), dtype=np.int32
+        )
+        self._process_width = process_width
+        self._small_buf = None
+        self._rgb_buf = None
 
     def process(self, frame_bgr: np.ndarray) -> List[TrackedHand]:
         """Run hand tracking on a BGR frame and return high-level results."""
         h, w, _ = frame_bgr.shape
-        frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
+        frame_in = frame_bgr
+        if 0 < self._process_width < w:
+            small_shape = (h * self._process_width // w, self._process_width, 3)
+            if self._small_buf is None or self._small_buf.shape != small_shape:
+                self._small_buf = np.empty(small_shape, dtype=frame_bgr.dtype)
+            frame_in = cv2.resize(
+                frame_bgr,
+                (small_shape[1], small_shape[0]),
+                dst=self._small_buf,
+                interpolation=cv2.INTER_AREA,
+            )
+
+        # Reuse one RGB buffer across frames instead of allocating per call
+        if self._rgb_buf is None or self._rgb_buf.shape != frame_in.shape:
+            self._rgb_buf = np.empty_like(frame_in)
+        self._rgb_buf.flags.writeable = True
+        frame_rgb = cv2.cvtColor(frame_in, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        # Read-only input lets MediaPipe pass the buffer by reference
+        frame_rgb.flags.writeable = False
 
         results = self._hands.process(frame_rgb)
         tracked: List[TrackedHand] = []
@@ -46,26 +93,28 @@ class HandTracker:
         if not results.multi_hand_landmarks:
             return tracked
 
-        for hand_landmarks, handedness in zip(
-            results.multi_hand_landmarks, results.multi_handedness
+        # Landmarks are normalized, so scale by the original (not downscaled) size
+        frame_size = np.array([w, h], dtype=np.float32)
+
+        for landmarks_px, hand_landmarks, handedness in zip(
+            self._landmarks_px, results.multi_hand_landmarks, results.multi_handedness
         ):
-            pts = []
-            for lm in hand_landmarks.landmark:
-                x_px = int(lm.x * w)
-                y_px = int(lm.y * h)
-                pts.append((x_px, y_px))
-
-            landmarks_px = np.array(pts, dtype=np.int32)
-            x_min = int(landmarks_px[:, 0].min())
-            y_min = int(landmarks_px[:, 1].min())
-            x_max = int(landmarks_px[:, 0].max())
-            y_max = int(landmarks_px[:, 1].max())
+            landmarks_norm = np.array(
+                [(lm.x, lm.y) for lm in hand_landmarks.landmark], dtype=np.float32
+            )
+            # Scale and truncate straight into this hand's slot of the shared buffer
+            np.multiply(landmarks_norm, frame_size, out=landmarks_px, casting="unsafe")
+            x_min, y_min = landmarks_px.min(axis=0).tolist()
+            x_max, y_max = landmarks_px.max(axis=0).tolist()
+            thumb_tip = hand_landmarks.landmark[4]
+            label = handedness.classification[0].label
 
             tracked.append(
                 TrackedHand(
-                    handedness=handedness.classification[0].label,
+                    handedness=_HANDEDNESS_LABELS.get(label, label),
                     landmarks_px=landmarks_px,
                     bbox=(x_min, y_min, x_max, y_max),
+                    thumb_tip_norm=(thumb_tip.x, thumb_tip.y),
                 )
             )
 
@@ -77,20 +126,19 @@ class HandTracker:
             return
 
         for hand in tracked:
-            for start_idx, end_idx in self._mp_hands.HAND_CONNECTIONS:
-                x1, y1 = hand.landmarks_px[start_idx]
-                x2, y2 = hand.landmarks_px[end_idx]
-                cv2.line(
-                    frame_bgr,
-                    (int(x1), int(y1)),
-                    (int(x2), int(y2)),
-                    (0, 255, 0),
-                    2,
-                    cv2.LINE_AA,
-                )
+            # (num_connections, 2, 2): every edge drawn in a single polylines call
+            segments = hand.landmarks_px[self._connections]
+            cv2.polylines(
+                frame_bgr,
+                segments,
+                isClosed=False,
+                color=(0, 255, 0),
+                thickness=2,
+                lineType=cv2.LINE_AA,
+            )
 
-            for x, y in hand.landmarks_px:
-                cv2.circle(frame_bgr, (int(x), int(y)), 3, (0, 255, 255), -1)
+            for x, y in hand.landmarks_px.tolist():
+                cv2.circle(frame_bgr, (x, y), 3, (0, 255, 255), -1)
 
             x_min, y_min, _, _ = hand.bbox
             cv2.putText(
@@ -114,28 +162,31 @@ def compute_pinch_distance(hand: TrackedHand) -> float:
     """Calculate distance between thumb tip (4) and index tip (8) in pixels."""
     if hand.landmarks_px.shape[0] < 9:
         return 0.0
-    thumb_tip = hand.landmarks_px[4]
-    index_tip = hand.landmarks_px[8]
-    return float(np.linalg.norm(thumb_tip - index_tip))
+    thumb_x, thumb_y = hand.landmarks_px[4].tolist()
+    index_x, index_y = hand.landmarks_px[8].tolist()
+    return math.hypot(thumb_x - index_x, thumb_y - index_y)
 
 
 def get_thumb_tip_position(hand: TrackedHand) -> Tuple[int, int]:
     """Get the thumb tip (landmark 4) position in pixels."""
     if hand.landmarks_px.shape[0] < 5:
         return (0, 0)
-    thumb_tip = hand.landmarks_px[4]
-    return (int(thumb_tip[0]), int(thumb_tip[1]))
+    thumb_x, thumb_y = hand.landmarks_px[4].tolist()
+    return (thumb_x, thumb_y)
+
+
+def get_thumb_tip_normalized(hand: TrackedHand) -> Tuple[float, float]:
+    """Get the thumb tip (landmark 4) position normalized to 0-1 by frame size."""
+    return hand.thumb_tip_norm
 
 
 def get_pinch_point(hand: TrackedHand) -> Tuple[int, int]:
     """Get the pinch point (midpoint between thumb tip and index tip) in pixels."""
     if hand.landmarks_px.shape[0] < 9:
         return (0, 0)
-    thumb_tip = hand.landmarks_px[4]
-    index_tip = hand.landmarks_px[8]
-    pinch_x = int((thumb_tip[0] + index_tip[0]) / 2)
-    pinch_y = int((thumb_tip[1] + index_tip[1]) / 2)
-    return (pinch_x, pinch_y)
+    thumb_x, thumb_y = hand.landmarks_px[4].tolist()
+    index_x, index_y = hand.landmarks_px[8].tolist()
+    return (int((thumb_x + index_x) / 2), int((thumb_y + index_y) / 2))
 
 
 # Visualization utilities
@@ -3,15 +3,21 @@ and RabbitMQ messaging on Raspberry Pi.
 """
 
 import argparse
+import math
+import os
 import time
+from pathlib import Path
 from typing import Optional, Tuple
 
 import cv2
 import numpy as np
+import torch
 from rich.console import Console
 from ultralytics import YOLO
+from ultralytics.engine.results import Results
 
-from rabbitmq import send_pinch_trigger, send_thumb_position, setup_rabbitmq_connection
+from capture import LatestFrame
+from rabbitmq import BackgroundPublisher
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -21,6 +27,31 @@ from rabbitmq import send_pinch_trigger, send_thumb_position, setup_rabbitmq_con
 # We define "pinch" as: right wrist close to head (nose), relative to shoulder width.
 PINCH_SCORE_THRESHOLD = 0.7  # smaller = closer to head -> "pinch"
 
+# After this many consecutive frames without a person, only every
+# IDLE_SHOW_EVERY-th frame is drawn and shown.
+IDLE_STREAK_FRAMES = 5
+IDLE_SHOW_EVERY = 5
+
+# Console status line refresh interval (seconds), ~4 Hz
+STATUS_INTERVAL = 0.25
+
+# FPS overlay: cached (height, width) patch in the top-left corner, redrawn at 2 Hz
+FPS_OVERLAY_SIZE = (40, 190)
+FPS_OVERLAY_INTERVAL = 0.5
+
+# Inference backends: export arguments and cached artifact suffix for each.
+# INT8 exports are calibrated on Ultralytics' small COCO pose sample dataset.
+CALIBRATION_DATA = "coco8-pose.yaml"
+BACKEND_EXPORTS = {
+    "ncnn": ({"format": "ncnn"}, "_ncnn_model"),
+    "openvino": ({"format": "openvino", "int8": True, "data": CALIBRATION_DATA}, "_int8_openvino_model"),
+    "tflite": ({"format": "tflite", "int8": True, "data": CALIBRATION_DATA}, "_int8.tflite"),
+}
+BACKENDS = ("torch", *BACKEND_EXPORTS)
+# NCNN needs no extra toolchain; the INT8 backends are opt-in because their export
+# pulls in ultralytics[export] (TensorFlow/onnx2tf or OpenVINO/NNCF) and calibration data
+DEFAULT_BACKEND = "ncnn"
+
 # Default model path – must be a YOLO11 *pose* model, e.g. yolo11n-pose.pt
 YOLO_MODEL_PATH = "yolo11n-pose.pt"
 
@@ -52,65 +83,161 @@ RIGHT_WRIST_IDX = 10
 # Keypoint / gesture utilities
 # ---------------------------------------------------------------------------
 
-def compute_body_scale_from_kpts(kpts: np.ndarray) -> float:
+# Keypoints the gesture needs, in this order. Only these 4 rows are copied off
+# the model output each frame, so the helpers below index them as 0..3.
+GESTURE_KPT_IDXS = [NOSE_IDX, LEFT_SHOULDER_IDX, RIGHT_SHOULDER_IDX, RIGHT_WRIST_IDX]
+
+
+def select_gesture_keypoints(result: Results) -> Optional[np.ndarray]:
     """
-    Estimate body scale as distance between shoulders.
-    Fallback to 1.0 if shoulders are not valid.
+    Return the (4, 2) GESTURE_KPT_IDXS keypoints of the detected person, or
+    None if nobody was found. Inference runs with max_det=1, so NMS already
+    kept only the most confident person and no argmax is needed; only the
+    gesture keypoints cross to NumPy.
     """
-    if kpts.shape[0] <= max(LEFT_SHOULDER_IDX, RIGHT_SHOULDER_IDX):
-        return 1.0
+    if result.keypoints is None or len(result.keypoints) == 0:
+        return None
 
-    ls = kpts[LEFT_SHOULDER_IDX]
-    rs = kpts[RIGHT_SHOULDER_IDX]
+    # (num_instances, num_kpts, 2) tensor, num_instances == 1
+    kpts_all = result.keypoints.xy
+    if kpts_all.shape[1] <= RIGHT_WRIST_IDX:
+        return None
 
-    # If shoulders collapse to 0,0 (sometimes when undetected), avoid zero scale
-    scale = float(np.linalg.norm(ls - rs))
-    return scale if scale > 1e-3 else 1.0
+    return kpts_all[0, GESTURE_KPT_IDXS].cpu().numpy()
 
 
-def compute_pinch_score_from_kpts(kpts: np.ndarray) -> float:
+def compute_pinch_score_and_point(kpts4: np.ndarray) -> Tuple[float, Tuple[int, int]]:
     """
-    Compute a normalized 'pinch score' between right wrist and head (nose).
+    Compute a normalized 'pinch score' between right wrist and head (nose),
+    plus the gesture point (right wrist, in pixels) used for drawing and sending.
     Lower score -> hand closer to head -> more 'pinch-like'.
 
+    `kpts4` is the (4, 2) array of GESTURE_KPT_IDXS keypoints.
+
     score = dist(right_wrist, nose) / body_scale
-    body_scale = distance between shoulders.
+    body_scale = distance between shoulders, falling back to 1.0 when the
+    shoulders collapse to the same point (sometimes when undetected).
     """
-    if kpts.shape[0] <= max(NOSE_IDX, RIGHT_WRIST_IDX):
-        return 1e9  # effectively "no pinch"
+    (nx, ny), (lsx, lsy), (rsx, rsy), (wx, wy) = kpts4.tolist()
+
+    scale = math.hypot(lsx - rsx, lsy - rsy)
+    if scale <= 1e-3:
+        scale = 1.0
+    dist_hw = math.hypot(wx - nx, wy - ny)
+    return dist_hw / scale, (int(wx), int(wy))
 
-    nose = kpts[NOSE_IDX]
-    rwrist = kpts[RIGHT_WRIST_IDX]
 
-    dist_hw = float(np.linalg.norm(rwrist - nose))
-    body_scale = compute_body_scale_from_kpts(kpts)
-    return dist_hw / body_scale
+def draw_target_visualization(frame: np.ndarray, point: Tuple[int, int]) -> None:
+    """Draw a small target marker at the given pixel point on the frame."""
+    x, y = point
+    h, w = frame.shape[:2]
+    # 1-px crosshair as two slice assignments instead of two cv2.line calls
+    if 0 <= y < h:
+        frame[y, max(0, x - 15):min(w, x + 16)] = (0, 0, 255)
+    if 0 <= x < w:
+        frame[max(0, y - 15):min(h, y + 16), x] = (0, 0, 255)
+    cv2.circle(frame, (x, y), 10, (0, 0, 255), 2)
+
 
+# ---------------------------------------------------------------------------
+# Model loading
+# ---------------------------------------------------------------------------
 
-def get_pinch_point_from_kpts(kpts: np.ndarray) -> Tuple[int, int]:
+def configure_torch_threads() -> None:
     """
-    Visual point for the 'pinch' marker.
-    We use the right wrist position as the gesture point.
+    Run PyTorch intra-op work on every core and keep inter-op parallelism
+    off; a single small model gains nothing from concurrent operators.
     """
-    rwrist = kpts[RIGHT_WRIST_IDX]
-    return int(rwrist[0]), int(rwrist[1])
+    torch.set_num_threads(os.cpu_count() or 4)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # can only be set before any inter-op parallel work has started
 
 
-def get_hand_position_from_kpts(kpts: np.ndarray) -> Tuple[int, int]:
+def load_model(model_path: str, imgsz: int, backend: str = DEFAULT_BACKEND) -> YOLO:
+    """
+    Load a YOLO pose model, exporting PyTorch `.pt` weights for `backend` once.
+    The export is cached next to the weights, keyed by imgsz and backend, and
+    reused on later runs. The "torch" backend and any other path (already
+    exported) are loaded as-is.
+    """
+    path = Path(model_path)
+    if backend == "torch":
+        configure_torch_threads()
+        return YOLO(model_path, task="pose")
+    if path.suffix != ".pt":
+        return YOLO(model_path, task="pose")
+
+    export_args, suffix = BACKEND_EXPORTS[backend]
+    export_path = path.with_name(f"{path.stem}_{imgsz}{suffix}")
+    if not export_path.exists():
+        exported = YOLO(model_path).export(imgsz=imgsz, **export_args)
+        Path(exported).rename(export_path)
+    return YOLO(str(export_path), task="pose")
+
+
+class LetterboxBuffer:
     """
-    Position to send instead of thumb tip (we only have wrists).
-    Right wrist in pixel coordinates.
+    Reusable square model input. Frames are resized into it keeping their
+    aspect ratio (gray padding, as Ultralytics does), so YOLO's own letterbox
+    becomes a no-op and no per-frame input image is allocated.
     """
-    rwrist = kpts[RIGHT_WRIST_IDX]
-    return int(rwrist[0]), int(rwrist[1])
 
+    def __init__(self, size: int) -> None:
+        """Allocate a gray `size` x `size` BGR buffer."""
+        self.size = size
+        self.buffer = np.full((size, size, 3), 114, dtype=np.uint8)
+        self.scale = 1.0
+        self.offset = np.zeros(2, dtype=np.float32)  # (pad_x, pad_y)
+        self._frame_shape: Optional[Tuple[int, int]] = None
+        self._roi: Optional[np.ndarray] = None
+
+    def fill(self, frame: np.ndarray) -> np.ndarray:
+        """Resize `frame` into the buffer and return the buffer."""
+        if frame.shape[:2] != self._frame_shape:
+            h, w = frame.shape[:2]
+            self.scale = min(self.size / w, self.size / h)
+            new_w, new_h = round(w * self.scale), round(h * self.scale)
+            pad_x, pad_y = (self.size - new_w) // 2, (self.size - new_h) // 2
+            self.offset[:] = (pad_x, pad_y)
+            self.buffer[:] = 114
+            self._roi = self.buffer[pad_y:pad_y + new_h, pad_x:pad_x + new_w]
+            self._frame_shape = frame.shape[:2]
+
+        cv2.resize(
+            frame,
+            (self._roi.shape[1], self._roi.shape[0]),
+            dst=self._roi,
+            interpolation=cv2.INTER_LINEAR,
+        )
+        return self.buffer
+
+    def to_frame(self, points: np.ndarray) -> np.ndarray:
+        """Map (N, 2) pixel points from buffer coordinates back to the frame."""
+        return (points - self.offset) / self.scale
 
-def draw_target_visualization(frame: np.ndarray, point: Tuple[int, int]) -> None:
-    """Draw a small target marker at the given pixel point on the frame."""
-    x, y = point
-    cv2.circle(frame, (x, y), 10, (0, 0, 255), 2)
-    cv2.line(frame, (x - 15, y), (x + 15, y), (0, 0, 255), 1)
-    cv2.line(frame, (x, y - 15), (x, y + 15), (0, 0, 255), 1)
+
+# ---------------------------------------------------------------------------
+# Display
+# ---------------------------------------------------------------------------
+
+# GPU-composited preview on the Pi; cv2.imshow's X11 blitting is CPU-heavy there
+GST_DISPLAY_PIPELINE = "appsrc ! videoconvert ! glimagesink sync=false"
+
+
+def open_gstreamer_display(width: int, height: int) -> Optional[cv2.VideoWriter]:
+    """Open the GStreamer preview sink, or return None if OpenCV lacks GStreamer."""
+    writer = cv2.VideoWriter(
+        GST_DISPLAY_PIPELINE, cv2.CAP_GSTREAMER, 0, 30.0, (width, height), True
+    )
+    return writer if writer.isOpened() else None
+
+
+def open_x11_window(title: str, width: int, height: int) -> None:
+    """Create a resizable cv2.imshow window for the frames."""
+    cv2.namedWindow(title, cv2.WINDOW_NORMAL)
+    cv2.resizeWindow(title, width, height)
 
 
 # ---------------------------------------------------------------------------
@@ -124,13 +251,30 @@ def run_live(
     max_num_hands: int = 1,  # kept for CLI compatibility (not used directly)
     use_picamera: bool = False,
     model_path: str = YOLO_MODEL_PATH,
+    infer_size: int = 320,
+    debug_draw: bool = False,
+    infer_stride: int = 1,
+    use_x11: bool = False,
+    backend: str = DEFAULT_BACKEND,
+    use_mjpg: bool = False,
 ) -> None:
     """Run live YOLO11 pose loop with RabbitMQ messaging."""
     console = Console()
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(os.cpu_count() or 4)
+
+    # Inference size is independent of capture size; YOLO needs a multiple of 32
+    imgsz = max(32, (infer_size // 32) * 32)
+
+    # Load YOLO model (pose), exported once for the selected backend
+    # Only .pt weights are exported; anything else is taken as an existing export
+    backend_label = backend if Path(model_path).suffix == ".pt" else "pre-exported, loaded unchanged"
+    console.print(f"[cyan]Loading YOLO11 pose model:[/cyan] {model_path} ([cyan]{backend_label}[/cyan])")
+    model = load_model(model_path, imgsz, backend)
 
-    # Load YOLO model (pose)
-    console.print(f"[cyan]Loading YOLO11 pose model:[/cyan] {model_path}")
-    model = YOLO(model_path)
+    # Persistent model input buffer; also warm up so the predictor is initialized
+    letterbox = LetterboxBuffer(imgsz)
+    model(letterbox.buffer, imgsz=imgsz, conf=0.5, verbose=False)
 
     cap: Optional[cv2.VideoCapture] = None
     picam2 = None
@@ -153,93 +297,118 @@ def run_live(
         picam2.preview_configuration.align()
         picam2.configure("preview")
         picam2.start()
+
+        def grab() -> Optional[np.ndarray]:
+            # PiCamera2 "RGB888" is BGR byte order – what both OpenCV and
+            # Ultralytics expect for ndarray input, so no conversion is needed
+            frame = picam2.capture_array()
+            # Rotate camera image 180° to match physical orientation
+            return cv2.rotate(frame, cv2.ROTATE_180)
+
         console.print("[green]✓[/green] Using PiCamera2 (Pi camera module)")
     else:
         # USB / other camera via OpenCV
         cap = cv2.VideoCapture(camera_index)
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+        # Keep the driver queue short so the capture thread never lags behind
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        if use_mjpg:
+            # Compressed USB transfer: less bandwidth and latency, one JPEG decode per frame
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG"))
 
         if not cap.isOpened():
             raise RuntimeError(f"Could not open camera index {camera_index}")
+
+        def grab() -> Optional[np.ndarray]:
+            success, frame = cap.read()
+            if not success:
+                return None
+            # Rotate camera image 180° to match physical orientation
+            return cv2.rotate(frame, cv2.ROTATE_180)
+
         console.print(f"[green]✓[/green] Using OpenCV VideoCapture({camera_index})")
 
     # -----------------------------------------------------------------------
     # RabbitMQ setup
     # -----------------------------------------------------------------------
     try:
-        rabbitmq_connection, rabbitmq_channel = setup_rabbitmq_connection()
+        publisher = BackgroundPublisher().start()
         console.print("[green]✓[/green] Connected to RabbitMQ")
     except Exception as e:
         console.print(f"[red]✗[/red] Failed to connect to RabbitMQ: {e}")
-        rabbitmq_connection = None
-        rabbitmq_channel = None
+        publisher = None
 
-    previous_time = time.time()
+    previous_time = time.monotonic()
     fps = 0.0
+    last_status_time = 0.0
+    fps_overlay = np.zeros((*FPS_OVERLAY_SIZE, 3), dtype=np.uint8)
+    fps_mask = np.zeros((*FPS_OVERLAY_SIZE, 1), dtype=bool)  # text pixels of fps_overlay
+    last_fps_draw_time = 0.0
     previous_pinch_state = False
+    pinch_bits = 0
+    empty_streak = 0
+    frame_idx = 0
+    last_kpts_xy: Optional[np.ndarray] = None
 
-    console.print("[dim]Press 'q' or ESC to quit.[/dim]")
-
-    # Create a resizable display window for the annotated frames
+    # Display: GStreamer sink unless --x11; the sink is opened at the first
+    # frame's size since cameras may not honor the requested resolution
     window_title = "HandyPi – YOLO11 pose full-body gesture"
-    cv2.namedWindow(window_title, cv2.WINDOW_NORMAL)
-    cv2.resizeWindow(window_title, width, height)
+    display: Optional[cv2.VideoWriter] = None
+    if use_x11:
+        open_x11_window(window_title, width, height)
+        console.print("[dim]Press 'q' or ESC to quit.[/dim]")
+    else:
+        console.print("[dim]Press CTRL+C to quit.[/dim]")
+
+    # Capture (and rotation) runs on its own thread, overlapping with inference
+    latest_frame = LatestFrame(grab).start()
 
     try:
         while True:
             # ---------------------------------------------------------------
-            # Grab frame
+            # Grab newest frame
             # ---------------------------------------------------------------
-            if use_picamera:
-                # PiCamera2 frame ("RGB888" which is in BGR byte order for OpenCV)
-                frame = picam2.capture_array()
-                # Convert BGR → RGB for YOLO, which expects RGB input
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                # Rotate camera image 180° to match physical orientation
-                frame = cv2.rotate(frame, cv2.ROTATE_180)
-            else:
-                success, frame = cap.read()
-                if not success:
-                    console.print("[red]Failed to read frame from camera.[/red]")
-                    break
-                # Rotate camera image 180° to match physical orientation
-                frame = cv2.rotate(frame, cv2.ROTATE_180)
-
-            # ---------------------------------------------------------------
-            # YOLO pose inference
-            # ---------------------------------------------------------------
-            # imgsz can be tuned; smaller for more speed on Pi
-            results = model(
-                frame,
-                imgsz=max(width, height),
-                conf=0.5,
-                verbose=False,
-            )
-
-            result = results[0]
-            annotated_frame = result.plot()  # draw boxes + keypoints
+            frame = latest_frame.read()
+            if frame is None:
+                console.print("[red]Failed to read frame from camera.[/red]")
+                break
 
             # ---------------------------------------------------------------
-            # Select keypoints for one instance (best by box confidence)
+            # YOLO pose inference (every infer_stride-th frame)
             # ---------------------------------------------------------------
-            kpts_xy = None
-            if result.keypoints is not None and len(result.keypoints) > 0:
-                # (num_instances, num_kpts, 2) tensor
-                kpts_all = result.keypoints.xy
-
-                if result.boxes is not None and len(result.boxes) == len(kpts_all):
-                    confs = result.boxes.conf.cpu().numpy()
-                    best_idx = int(np.argmax(confs))
-                else:
-                    best_idx = 0
+            fresh_kpts = frame_idx % infer_stride == 0
+            if fresh_kpts:
+                # --debug-draw feeds the full frame so result.plot() renders at
+                # capture size; otherwise frames go through the reusable buffer
+                model_input = frame if debug_draw else letterbox.fill(frame)
+                # Only the single most confident person (COCO class 0) is kept
+                results = model(
+                    model_input,
+                    imgsz=imgsz,
+                    conf=0.5,
+                    classes=[0],
+                    max_det=1,
+                    verbose=False,
+                )
 
-                kpts_xy = kpts_all[best_idx].cpu().numpy()
+                result = results[0]
+                kpts_xy = select_gesture_keypoints(result)
+                if kpts_xy is not None:
+                    if debug_draw:
+                        frame = result.plot()  # full boxes + skeleton, development only
+                    else:
+                        kpts_xy = letterbox.to_frame(kpts_xy)
+                last_kpts_xy = kpts_xy
+            else:
+                # In between, gesture state and drawing use the latest keypoints
+                kpts_xy = last_kpts_xy
+            frame_idx += 1
 
             # ---------------------------------------------------------------
             # FPS calculation
             # ---------------------------------------------------------------
-            current_time = time.time()
+            current_time = time.monotonic()
             delta_time = current_time - previous_time
             previous_time = current_time
             if delta_time > 0:
@@ -248,85 +417,127 @@ def run_live(
             # ---------------------------------------------------------------
             # Gesture ("pinch") + RabbitMQ logic
             # ---------------------------------------------------------------
-            if kpts_xy is not None and kpts_xy.shape[0] > RIGHT_WRIST_IDX:
-                pinch_score = compute_pinch_score_from_kpts(kpts_xy)
-                is_pinching = pinch_score < PINCH_SCORE_THRESHOLD
+            if kpts_xy is not None:
+                pinch_score, hand_point = compute_pinch_score_and_point(kpts_xy)
+                # Majority vote over the last 3 raw decisions (one bit per inference,
+                # not per frame, so --infer-stride reuse doesn't count twice) so
+                # jitter around the threshold doesn't flip the published state
+                if fresh_kpts:
+                    pinch_bits = ((pinch_bits << 1) | (pinch_score < PINCH_SCORE_THRESHOLD)) & 0b111
+                    is_pinching = pinch_bits.bit_count() >= 2
+                else:
+                    is_pinching = previous_pinch_state
+
+                # Right-wrist marker (the gesture point)
+                cv2.circle(frame, hand_point, 6, (0, 255, 0), -1)
 
                 # Send pinch state change
-                if is_pinching != previous_pinch_state and rabbitmq_channel is not None:
-                    try:
-                        send_pinch_trigger(rabbitmq_channel, is_pinching)
-                    except Exception as e:
-                        console.print(f"[red]Failed to send message: {e}[/red]")
+                if is_pinching != previous_pinch_state and publisher is not None:
+                    publisher.publish_pinch_trigger(is_pinching)
 
                 # On pinch start, send hand position (right wrist)
-                if is_pinching and not previous_pinch_state and rabbitmq_channel is not None:
-                    try:
-                        hand_x_px, hand_y_px = get_hand_position_from_kpts(kpts_xy)
-                        frame_height, frame_width = annotated_frame.shape[:2]
-                        hand_x_normalized = hand_x_px / frame_width
-                        hand_y_normalized = hand_y_px / frame_height
-                        # Reuse existing function name for thumb position
-                        send_thumb_position(
-                            rabbitmq_channel,
-                            hand_x_normalized,
-                            hand_y_normalized,
-                        )
-                    except Exception as e:
-                        console.print(f"[red]Failed to send position: {e}[/red]")
+                if is_pinching and not previous_pinch_state and publisher is not None:
+                    hand_x_px, hand_y_px = hand_point
+                    frame_height, frame_width = frame.shape[:2]
+                    hand_x_normalized = hand_x_px / frame_width
+                    hand_y_normalized = hand_y_px / frame_height
+                    # Reuse existing thumb position message for the hand position
+                    publisher.publish_thumb_position(hand_x_normalized, hand_y_normalized)
 
                 # Draw target when "pinching" (hand raised)
                 if is_pinching:
-                    pinch_point = get_pinch_point_from_kpts(kpts_xy)
-                    draw_target_visualization(annotated_frame, pinch_point)
+                    draw_target_visualization(frame, hand_point)
 
                 previous_pinch_state = is_pinching
 
-                pinch_status = "[green]PINCH[/green]" if is_pinching else "[dim]-----[/dim]"
-                console.print(
-                    f"Instance: [cyan]{0}[/cyan] | "
-                    f"score: [yellow]{pinch_score:6.3f}[/yellow] | "
-                    f"{pinch_status}      ",
-                    end="\r",
-                )
+                # Status line is throttled; the gesture logic above runs every frame
+                if current_time - last_status_time >= STATUS_INTERVAL:
+                    last_status_time = current_time
+                    pinch_status = "[green]PINCH[/green]" if is_pinching else "[dim]-----[/dim]"
+                    console.print(
+                        f"Instance: [cyan]{0}[/cyan] | "
+                        f"score: [yellow]{pinch_score:6.3f}[/yellow] | "
+                        f"{pinch_status}      ",
+                        end="\r",
+                    )
             else:
                 # No person/keypoints detected – always reset local pinch state.
-                # Only guard the RabbitMQ publish on channel availability.
-                if previous_pinch_state and rabbitmq_channel is not None:
-                    try:
-                        send_pinch_trigger(rabbitmq_channel, False)
-                    except Exception as e:
-                        console.print(f"[red]Failed to send message: {e}[/red]")
+                # Only guard the RabbitMQ publish on publisher availability.
+                if previous_pinch_state and publisher is not None:
+                    publisher.publish_pinch_trigger(False)
                 previous_pinch_state = False
+                pinch_bits = 0
+
+            # ---------------------------------------------------------------
+            # Idle: nobody in view for a while – refresh the preview rarely
+            # ---------------------------------------------------------------
+            empty_streak = 0 if kpts_xy is not None else empty_streak + 1
+            show_frame = empty_streak <= IDLE_STREAK_FRAMES or empty_streak % IDLE_SHOW_EVERY == 0
 
             # ---------------------------------------------------------------
             # Draw FPS & show
             # ---------------------------------------------------------------
-            cv2.putText(
-                annotated_frame,
-                f"{fps:.1f} FPS",
-                (10, 30),
-                cv2.FONT_HERSHEY_SIMPLEX,
-                1.0,
-                (0, 255, 0),
-                2,
-                cv2.LINE_AA,
-            )
+            if show_frame:
+                # Text is rasterized into a small cached patch at 2 Hz and only its
+                # text pixels are copied onto each frame
+                if current_time - last_fps_draw_time >= FPS_OVERLAY_INTERVAL:
+                    last_fps_draw_time = current_time
+                    fps_overlay[:] = 0
+                    cv2.putText(
+                        fps_overlay,
+                        f"{fps:.1f} FPS",
+                        (10, 30),
+                        cv2.FONT_HERSHEY_SIMPLEX,
+                        1.0,
+                        (0, 255, 0),
+                        2,
+                        cv2.LINE_8,
+                    )
+                    np.any(fps_overlay, axis=2, keepdims=True, out=fps_mask)
+                overlay_h = min(FPS_OVERLAY_SIZE[0], frame.shape[0])
+                overlay_w = min(FPS_OVERLAY_SIZE[1], frame.shape[1])
+                np.copyto(
+                    frame[:overlay_h, :overlay_w],
+                    fps_overlay[:overlay_h, :overlay_w],
+                    where=fps_mask[:overlay_h, :overlay_w],
+                )
 
-            cv2.imshow(window_title, annotated_frame)
-            key = cv2.waitKey(1) & 0xFF
-            if key in (ord("q"), 27):  # 'q' or ESC
-                break
+                if not use_x11 and display is None:
+                    display = open_gstreamer_display(frame.shape[1], frame.shape[0])
+                    if display is None:
+                        console.print("[yellow]⚠[/yellow] GStreamer display unavailable, using cv2.imshow")
+                        console.print("[dim]Press 'q' or ESC to quit.[/dim]")
+                        use_x11 = True
+                        open_x11_window(window_title, width, height)
 
+                if display is not None:
+                    display.write(frame)
+                else:
+                    cv2.imshow(window_title, frame)
+
+            # HighGUI events are pumped every iteration, even when idle frames aren't shown
+            if use_x11:
+                key = cv2.pollKey() & 0xFF
+                if key in (ord("q"), 27):  # 'q' or ESC
+                    break
+
+    except KeyboardInterrupt:
+        pass
     finally:
         # Cleanup
-        if cap is not None:
+        # Never release the camera while the capture thread may still be reading it
+        capture_stopped = latest_frame.stop()
+        if not capture_stopped:
+            console.print("[yellow]⚠[/yellow] Capture thread did not stop; leaving the camera open")
+        if display is not None:
+            display.release()
+        if cap is not None and capture_stopped:
             cap.release()
         cv2.destroyAllWindows()
-        if picam2 is not None:
+        if picam2 is not None and capture_stopped:
             picam2.stop()
-        if rabbitmq_connection and not rabbitmq_connection.is_closed:
-            rabbitmq_connection.close()
+        if publisher is not None:
+            publisher.close()
         console.print("\n[green]Done.[/green]")
 
 
@@ -368,11 +579,48 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Use PiCamera2 (for Raspberry Pi camera modules)",
     )
+    parser.add_argument(
+        "--mjpg",
+        action="store_true",
+        help="Request MJPG from USB cameras to cut USB bandwidth and capture latency",
+    )
     parser.add_argument(
         "--model",
         type=str,
         default=YOLO_MODEL_PATH,
-        help="Path to YOLO11 pose model (default: yolo11n-pose.pt or exported variant)",
+        help="Path to YOLO11 pose model; .pt weights are exported for --backend once and cached "
+        "(default: yolo11n-pose.pt)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=DEFAULT_BACKEND,
+        help="Inference backend for .pt weights: torch (no export), ncnn, or INT8 "
+        f"openvino/tflite, which need ultralytics[export] (default: {DEFAULT_BACKEND})",
+    )
+    parser.add_argument(
+        "--infer-size",
+        type=int,
+        default=320,
+        help="YOLO inference size in pixels, rounded down to a multiple of 32. "
+        "Smaller is faster (cost grows ~quadratically) but less accurate for "
+        "distant people; capture/display resolution is unaffected (default: 320)",
+    )
+    parser.add_argument(
+        "--debug-draw",
+        action="store_true",
+        help="Draw YOLO's full boxes and skeleton (slower; for development)",
+    )
+    parser.add_argument(
+        "--infer-stride",
+        type=int,
+        default=1,
+        help="Run YOLO on every Nth frame and reuse the last keypoints in between (default: 1)",
+    )
+    parser.add_argument(
+        "--x11",
+        action="store_true",
+        help="Preview with cv2.imshow instead of the GStreamer glimagesink pipeline",
     )
     return parser.parse_args()
 
@@ -387,6 +635,12 @@ def main() -> None:
         max_num_hands=args.max_hands,
         use_picamera=args.picamera,
         model_path=args.model,
+        infer_size=args.infer_size,
+        debug_draw=args.debug_draw,
+        infer_stride=max(1, args.infer_stride),
+        use_x11=args.x11,
+        backend=args.backend,
+        use_mjpg=args.mjpg,
     )
 
 